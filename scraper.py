@@ -14,26 +14,45 @@ Local usage:
     python scraper.py --dry-run          # Test config, no scraping
     python scraper.py --source linkedin  # Scrape single source
     python scraper.py --reset            # Clear seen jobs DB
+    python scraper.py --no-cache         # Fetch fresh pages, skip HTTP cache
 """
 
+import io
 import os
 import sys
 import json
 import re
+import string
 import hashlib
+import heapq
+import sqlite3
 import logging
 import argparse
 import time
 import random
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from pathlib import Path
 from dataclasses import dataclass, field, asdict
+from functools import cached_property
+from html import escape
 from typing import Optional
-from urllib.parse import urlencode, quote_plus
+from urllib.parse import urlencode, quote_plus, urlsplit
 
 import yaml
 import requests
-from bs4 import BeautifulSoup
+import requests_cache
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
+import lxml.html
+from lxml import etree
+from cssselect import HTMLTranslator
+
+try:
+    import ahocorasick  # pyahocorasick
+except ImportError:  # optional accelerator, KeywordMatcher falls back to plain scans
+    ahocorasick = None
 
 # ── Logging ──────────────────────────────────────────────────
 logging.basicConfig(
@@ -43,6 +62,11 @@ logging.basicConfig(
 )
 log = logging.getLogger("jobscraper")
 
+# Run banners, built once
+BANNER = "=" * 60
+SECTION_RULE = "─" * 40
+DONE_RULE = "═" * 40
+
 IS_CI = os.environ.get("GITHUB_ACTIONS") == "true"
 
 def set_github_env(key, value):
@@ -55,7 +79,10 @@ def set_github_env(key, value):
 
 
 # ── Data Model ───────────────────────────────────────────────
-@dataclass
+_PUNCT_TABLE = str.maketrans("", "", string.punctuation)
+
+
+@dataclass(slots=True)
 class JobPosting:
     title: str
     company: str
@@ -72,7 +99,15 @@ class JobPosting:
     def __post_init__(self):
         if not self.job_id:
             raw = f"{self.title}|{self.company}|{self.url}"
-            self.job_id = hashlib.md5(raw.encode()).hexdigest()
+            self.job_id = hashlib.md5(raw.encode(), usedforsecurity=False).hexdigest()
+
+    @property
+    def signature(self) -> tuple:
+        """Normalised title + company, shared by reposts of a role across boards."""
+        if not self.company.strip():
+            return (self.job_id,)
+        title = " ".join(self.title.lower().translate(_PUNCT_TABLE).split())
+        return (title, " ".join(self.company.lower().split()))
 
 
 # ── Configuration ────────────────────────────────────────────
@@ -84,159 +119,309 @@ class Config:
     def __getattr__(self, key):
         return self._cfg.get(key, {})
 
-    @property
+    @cached_property
     def target_titles(self):
         return [t.lower() for t in self._cfg["profile"]["target_titles"]]
 
-    @property
+    @cached_property
     def positive_keywords(self):
         return [k.lower() for k in self._cfg["profile"]["positive_keywords"]]
 
-    @property
+    @cached_property
     def negative_keywords(self):
         return [k.lower() for k in self._cfg["profile"]["negative_keywords"]]
 
-    @property
+    @cached_property
     def min_score(self):
         return self._cfg["profile"]["min_relevance_score"]
 
-    @property
+    @cached_property
     def search_queries(self):
         return self._cfg["search_queries"]
 
-    @property
+    @cached_property
     def location_include(self):
         return [l.lower() for l in self._cfg["locations"]["include"]]
 
-    @property
+    @cached_property
     def location_exclude(self):
         return [l.lower() for l in self._cfg["locations"]["exclude"]]
 
-    @property
+    @cached_property
     def seniority_indicators(self):
         return [s.lower() for s in self._cfg["salary"]["seniority_indicators"]]
 
-    @property
+    @cached_property
     def target_companies(self):
         companies = []
         for category in self._cfg.get("target_companies", {}).values():
             companies.extend(category)
         return companies
 
+    @cached_property
+    def target_companies_lower(self):
+        return [(tc, tc["name"].lower()) for tc in self.target_companies]
+
 
 # ── Seen Jobs Database ───────────────────────────────────────
 class SeenJobsDB:
-    """Track previously seen jobs. State persists via git commits in CI."""
-
-    def __init__(self, path="./data/seen_jobs.json"):
+    """Track previously seen jobs in SQLite. State persists via git commits in CI."""
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS seen (
+            job_id     TEXT PRIMARY KEY,
+            title      TEXT,
+            company    TEXT,
+            first_seen TEXT,
+            score      REAL
+        );
+        CREATE INDEX IF NOT EXISTS seen_first_seen ON seen(first_seen);
+        CREATE TABLE IF NOT EXISTS meta (
+            key   TEXT PRIMARY KEY,
+            value TEXT
+        );
+    """
+
+    def __init__(self, path="./data/seen_jobs.db"):
         self.path = Path(path)
         self.path.parent.mkdir(parents=True, exist_ok=True)
-        self.data = self._load()
-
-    def _load(self):
-        if self.path.exists():
-            try:
-                with open(self.path) as f:
-                    return json.load(f)
-            except (json.JSONDecodeError, KeyError):
-                log.warning("Corrupted seen_jobs.json, starting fresh")
-        return {"seen": {}, "last_run": None, "stats": {"total_seen": 0, "total_reported": 0}}
-
-    def save(self):
-        self.data["last_run"] = datetime.now().isoformat()
-        with open(self.path, "w") as f:
-            json.dump(self.data, f, indent=2, default=str)
-
-    def is_new(self, job: JobPosting) -> bool:
-        return job.job_id not in self.data["seen"]
-
-    def mark_seen(self, job: JobPosting):
-        self.data["seen"][job.job_id] = {
-            "title": job.title,
-            "company": job.company,
-            "first_seen": datetime.now().isoformat(),
-            "score": job.relevance_score,
-        }
-
-    def cleanup(self, days=30):
-        cutoff = datetime.now() - timedelta(days=days)
-        before = len(self.data["seen"])
-        self.data["seen"] = {
-            k: v for k, v in self.data["seen"].items()
-            if datetime.fromisoformat(v["first_seen"]) > cutoff
-        }
-        removed = before - len(self.data["seen"])
+        self.conn = sqlite3.connect(self.path)
+        # The file is committed to git after each run, so keep the default
+        # rollback journal (no -wal/-shm side files) and just sync less often.
+        self.conn.execute("PRAGMA synchronous = NORMAL")
+        self.conn.executescript(self.SCHEMA)
+        self._import_legacy_json(self.path.with_suffix(".json"))
+
+    def _import_legacy_json(self, json_path):
+        """One-time migration from the old seen_jobs.json store."""
+        if not json_path.exists():
+            return
+        try:
+            with open(json_path) as f:
+                legacy = json.load(f)
+        except (json.JSONDecodeError, KeyError):
+            log.warning(f"Corrupted {json_path.name}, skipping import")
+            legacy = {}
+        self.conn.executemany(
+            "INSERT OR IGNORE INTO seen (job_id, title, company, first_seen, score) VALUES (?, ?, ?, ?, ?)",
+            [
+                (job_id, v.get("title"), v.get("company"), v.get("first_seen"), v.get("score"))
+                for job_id, v in legacy.get("seen", {}).items()
+            ],
+        )
+        stats = legacy.get("stats") or {}
+        self._set_meta("total_reported", stats.get("total_reported", 0))
+        if legacy.get("last_run"):
+            self._set_meta("last_run", legacy["last_run"])
+        self.conn.commit()
+        json_path.unlink()
+        log.info(f"Imported {len(legacy.get('seen', {}))} entries from {json_path.name}")
+
+    def _get_meta(self, key, default=None):
+        row = self.conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else default
+
+    def _set_meta(self, key, value):
+        self.conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, str(value)))
+
+    def save(self, now: Optional[datetime] = None):
+        self._set_meta("last_run", (now or datetime.now()).isoformat())
+        self.conn.commit()
+
+    def close(self):
+        self.conn.close()
+
+    def seen_scores(self, job_ids) -> dict:
+        """Stored score for each of ``job_ids`` already seen, in batched lookups."""
+        job_ids = list(job_ids)
+        scores = {}
+        for i in range(0, len(job_ids), 500):
+            batch = job_ids[i:i + 500]
+            placeholders = ",".join("?" * len(batch))
+            scores.update(self.conn.execute(
+                f"SELECT job_id, score FROM seen WHERE job_id IN ({placeholders})", batch
+            ))
+        return scores
+
+    def mark_seen(self, job: JobPosting, now: Optional[datetime] = None):
+        self.mark_seen_many([job], now)
+
+    def mark_seen_many(self, jobs, now: Optional[datetime] = None):
+        # One executemany inside the implicit transaction that save() commits,
+        # so a whole run's inserts cost a single write to disk.
+        first_seen = (now or datetime.now()).isoformat()
+        self.conn.executemany(
+            "INSERT OR IGNORE INTO seen (job_id, title, company, first_seen, score) VALUES (?, ?, ?, ?, ?)",
+            [(job.job_id, job.title, job.company, first_seen, job.relevance_score) for job in jobs],
+        )
+
+    def cleanup(self, days=30, now: Optional[datetime] = None):
+        cutoff = (now or datetime.now()) - timedelta(days=days)
+        removed = self.conn.execute(
+            "DELETE FROM seen WHERE first_seen <= ?", (cutoff.isoformat(),)
+        ).rowcount
+        self.conn.commit()
         if removed:
             log.info(f"Cleaned up {removed} entries older than {days} days")
 
     def reset(self):
-        self.data = {"seen": {}, "last_run": None, "stats": {"total_seen": 0, "total_reported": 0}}
+        self.conn.execute("DELETE FROM seen")
+        self.conn.execute("DELETE FROM meta")
         self.save()
         log.info("Seen jobs database reset.")
 
     def update_stats(self, new_count):
-        if "stats" not in self.data:
-            self.data["stats"] = {"total_seen": 0, "total_reported": 0}
-        self.data["stats"]["total_seen"] = len(self.data["seen"])
-        self.data["stats"]["total_reported"] += new_count
+        total_reported = int(self._get_meta("total_reported", 0)) + new_count
+        self._set_meta("total_reported", total_reported)
+
+    @property
+    def stats(self):
+        total_seen = self.conn.execute("SELECT COUNT(*) FROM seen").fetchone()[0]
+        return {"total_seen": total_seen, "total_reported": int(self._get_meta("total_reported", 0))}
+
+
+# ── Keyword Matching ─────────────────────────────────────────
+class KeywordMatcher:
+    """Substring matcher for a fixed keyword list.
+
+    Builds one Aho–Corasick automaton so a text is scanned once for all
+    keywords; without pyahocorasick it checks keyword by keyword. Results
+    always follow the order of the configured list.
+    """
+
+    def __init__(self, keywords):
+        self.keywords = list(keywords)
+        self._automaton = None
+        if ahocorasick is not None and all(self.keywords):
+            automaton = ahocorasick.Automaton()
+            for kw in self.keywords:
+                automaton.add_word(kw, kw)
+            if len(automaton):
+                automaton.make_automaton()
+                self._automaton = automaton
+
+    def hits(self, text) -> set[str]:
+        """Every keyword that occurs in ``text``, unordered."""
+        if self._automaton is None:
+            return {kw for kw in self.keywords if kw in text}
+        return {kw for _, kw in self._automaton.iter(text)}
+
+    def find_all(self, text) -> list[str]:
+        hits = self.hits(text)
+        if not hits:
+            return []
+        return [kw for kw in self.keywords if kw in hits]
+
+
+class KeywordGroups:
+    """Several keyword lists matched against the same text in one scan.
+
+    All lists share a single KeywordMatcher; ``scan`` splits the hits back
+    out per group, each in the order of its configured list.
+    """
+
+    def __init__(self, **groups):
+        self.groups = {name: list(keywords) for name, keywords in groups.items()}
+        self._matcher = KeywordMatcher([kw for kws in self.groups.values() for kw in kws])
+
+    def scan(self, text) -> dict[str, list[str]]:
+        hits = self._matcher.hits(text)
+        return {name: [kw for kw in kws if kw in hits] for name, kws in self.groups.items()}
 
 
 # ── Relevance Scorer ─────────────────────────────────────────
+SALARY_RE = re.compile(r'(\d{2,3})[.,]?(\d{3})?\s*(?:€|eur|euro)', re.IGNORECASE)
+
+
 class RelevanceScorer:
+    # Best score a posting can reach without a title match:
+    # seniority + keywords + location + company + salary
+    MAX_WITHOUT_TITLE = 15 + 30 + 20 + 15 + 10
+    NEGATIVE_PENALTY = 40
+
     def __init__(self, config: Config):
         self.cfg = config
+        self._min_score = config.min_score
+        # Lists checked against the same text share one scan
+        self._title_kw = KeywordGroups(
+            title=config.target_titles,
+            seniority=config.seniority_indicators,
+            negative=config.negative_keywords,
+        )
+        self._loc_kw = KeywordGroups(
+            include=config.location_include,
+            exclude=config.location_exclude,
+        )
+        self._pos_ac = KeywordMatcher(config.positive_keywords)
+        self._companies = config.target_companies_lower
+        self._company_ac = KeywordMatcher([name for _, name in self._companies])
+
+    def _match_company(self, company_lower):
+        """First target company whose name contains, or is contained in, the company."""
+        forward = self._company_ac.hits(company_lower)
+        for tc, name in self._companies:
+            if name in forward or company_lower in name:
+                return tc
+        return None
 
     def score(self, job: JobPosting) -> JobPosting:
         score = 0.0
         reasons = []
-        text = f"{job.title} {job.company} {job.description} {job.location}".lower()
 
-        # Title match (0–35)
+        # Title-only prefilter: no target title plus enough negative keywords
+        # means the posting cannot reach min_score, so skip the full sweep.
         title_lower = job.title.lower()
-        for target in self.cfg.target_titles:
-            if target in title_lower:
-                score += 35
-                reasons.append(f"Title match: '{target}'")
-                break
-        else:
-            for indicator in self.cfg.seniority_indicators:
-                if indicator in title_lower:
-                    score += 15
-                    reasons.append(f"Seniority match: '{indicator}'")
-                    break
+        title_hits = self._title_kw.scan(title_lower)
+        neg_hits = title_hits["negative"]
+        if not title_hits["title"] and neg_hits:
+            best = self.MAX_WITHOUT_TITLE - self.NEGATIVE_PENALTY * len(neg_hits)
+            if max(0, best) < self._min_score:
+                job.relevance_score = 0
+                job.match_reasons = [f"Negative: '{neg}'" for neg in neg_hits]
+                return job
+
+        # Lowercase each field once; the combined texts below reuse them.
+        company_lower = job.company.lower()
+        desc_lower = job.description.lower()
+        location_lower = job.location.lower()
+        text = " ".join((title_lower, company_lower, desc_lower, location_lower))
+
+        # Title match (0–35)
+        if title_hits["title"]:
+            score += 35
+            reasons.append(f"Title match: '{title_hits['title'][0]}'")
+        elif title_hits["seniority"]:
+            score += 15
+            reasons.append(f"Seniority match: '{title_hits['seniority'][0]}'")
 
         # Industry/function keywords (0–30)
-        kw_hits = [kw for kw in self.cfg.positive_keywords if kw in text]
+        kw_hits = self._pos_ac.find_all(text)
         if kw_hits:
             kw_score = min(30, len(kw_hits) * 5)
             score += kw_score
             reasons.append(f"Keywords ({len(kw_hits)}): {', '.join(kw_hits[:5])}")
 
         # Location match (0–20)
-        loc_lower = f"{job.location} {job.description[:500]}".lower()
-        for loc in self.cfg.location_include:
-            if loc in loc_lower:
-                score += 20
-                reasons.append(f"Location: '{loc}'")
-                break
+        loc_lower = f"{location_lower} {desc_lower[:500]}"
+        loc_hits = self._loc_kw.scan(loc_lower)
+        if loc_hits["include"]:
+            score += 20
+            reasons.append(f"Location: '{loc_hits['include'][0]}'")
 
         # Location exclusion
-        for exc in self.cfg.location_exclude:
-            if exc in loc_lower:
-                score -= 50
-                reasons.append(f"Location excluded: '{exc}'")
+        for exc in loc_hits["exclude"]:
+            score -= 50
+            reasons.append(f"Location excluded: '{exc}'")
 
         # Company match (0–15)
-        company_lower = job.company.lower()
-        for tc in self.cfg.target_companies:
-            if tc["name"].lower() in company_lower or company_lower in tc["name"].lower():
-                score += 15
-                reasons.append(f"Target company: {tc['name']}")
-                break
+        tc = self._match_company(company_lower)
+        if tc:
+            score += 15
+            reasons.append(f"Target company: {tc['name']}")
 
         # Salary indicators
-        salary_text = f"{job.salary_info} {job.description[:1000]}".lower()
-        salary_match = re.search(r'(\d{2,3})[.,]?(\d{3})?\s*(?:€|eur|euro)', salary_text)
+        salary_text = f"{job.salary_info.lower()} {desc_lower[:1000]}"
+        salary_match = SALARY_RE.search(salary_text)
         if salary_match:
             try:
                 amount = int(salary_match.group(1)) * (1000 if not salary_match.group(2) else 1)
@@ -252,10 +437,9 @@ class RelevanceScorer:
                 pass
 
         # Negative keyword penalty
-        for neg in self.cfg.negative_keywords:
-            if neg in title_lower:
-                score -= 40
-                reasons.append(f"Negative: '{neg}'")
+        for neg in neg_hits:
+            score -= self.NEGATIVE_PENALTY
+            reasons.append(f"Negative: '{neg}'")
 
         job.relevance_score = max(0, min(100, score))
         job.match_reasons = reasons
@@ -263,8 +447,44 @@ class RelevanceScorer:
 
 
 # ── HTTP Session ─────────────────────────────────────────────
-def create_session() -> requests.Session:
-    session = requests.Session()
+def create_session(use_cache=True) -> requests.Session:
+    """Shared session; the pooled adapter lets scraper threads reuse connections.
+
+    Successful responses are cached in SQLite for an hour, so overlapping
+    queries and quick re-runs don't hit the job boards again. After that
+    they are revalidated with If-None-Match / If-Modified-Since, and a 304
+    reuses the stored body instead of downloading the page again.
+    """
+    if use_cache:
+        session = requests_cache.CachedSession(
+            "data/http_cache",
+            backend="sqlite",
+            expire_after=3600,
+            allowable_codes=(200,),
+        )
+        # Expired entries are kept for their validators; drop the long-dead ones
+        session.cache.delete(older_than=timedelta(days=7))
+    else:
+        session = requests.Session()
+    # Transient server errors and failed connects are retried with a short
+    # backoff (about 3 s in total). 429 is not retried: a throttled board gets
+    # no immediate re-request, the scrapers back off with polite_delay and
+    # skip the query. Read timeouts are not retried either, so a hung board
+    # costs one timeout per query. Retry-After is ignored: boards send values
+    # of minutes to hours, which would stall a scraper thread past the CI
+    # timeout. Once retries run out the last response is returned so scrapers
+    # see the status code instead of an exception.
+    retry = Retry(
+        total=3,
+        read=0,
+        backoff_factor=0.5,
+        status_forcelist=(500, 502, 503, 504),
+        respect_retry_after_header=False,
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(pool_connections=32, pool_maxsize=32, max_retries=retry)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
     session.headers.update({
         "User-Agent": (
             "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
@@ -277,10 +497,82 @@ def create_session() -> requests.Session:
     return session
 
 
-def polite_delay(min_s=1.5, max_s=3.5):
+def polite_delay(min_s=1.5, max_s=3.5, resp=None):
+    if getattr(resp, "from_cache", False) and not getattr(resp, "revalidated", False):
+        return  # served from the HTTP cache, the site never saw a request
     time.sleep(random.uniform(min_s, max_s))
 
 
+_host_locks = {}
+_host_locks_guard = threading.Lock()
+
+
+def host_lock(url) -> threading.Lock:
+    """Per-hostname lock: requests to the same host stay serialized across threads."""
+    host = urlsplit(url).hostname or ""
+    with _host_locks_guard:
+        return _host_locks.setdefault(host, threading.Lock())
+
+
+# ── HTML Parsing ─────────────────────────────────────────────
+class XPathSelector:
+    """CSS selector list compiled once into a single lxml XPath.
+
+    Matches what soupsieve's select()/select_one() would: descendants of the
+    given element, in document order, where the selector's ancestor and
+    sibling parts may also match outside that element. The whole union is
+    evaluated in C.
+    """
+
+    _translator = HTMLTranslator()
+    # Everything a selector's leftmost part can match for a hit inside the
+    # context element: its ancestors, their earlier siblings, its descendants
+    _SCOPE = "(ancestor-or-self::* | ancestor-or-self::*/preceding-sibling::* | descendant::*)/self::"
+    _INSIDE = "count(ancestor::* | $ctx) = count(ancestor::*)"
+
+    def __init__(self, css):
+        self.css = css
+        expr = self._translator.css_to_xpath(css, prefix=self._SCOPE)
+        self._select = etree.XPath(f"({expr})[{self._INSIDE}]")
+        self._select_one = etree.XPath(f"(({expr})[{self._INSIDE}])[1]")
+
+    def select(self, el, limit=None) -> list:
+        found = self._select(el, ctx=el)
+        return found[:limit] if limit else found
+
+    def select_one(self, el):
+        found = self._select_one(el, ctx=el)
+        return found[0] if found else None
+
+
+META_CHARSET_RE = re.compile(rb"<meta[^>]+charset", re.IGNORECASE)
+
+
+def html_encoding(resp) -> Optional[str]:
+    """Encoding to hand to libxml2, or None to let it read <meta charset>.
+
+    libxml2 only looks at the meta tag, so fall back to the charset from
+    the Content-Type header, then to UTF-8, instead of its Latin-1 default.
+    """
+    if "charset=" in resp.headers.get("Content-Type", "").lower():
+        return resp.encoding
+    if not META_CHARSET_RE.search(resp.content[:4096]):
+        return "utf-8"
+    return None
+
+
+def parse_html(resp):
+    """Parse a response body into an lxml tree."""
+    encoding = html_encoding(resp)
+    parser = lxml.html.HTMLParser(encoding=encoding) if encoding else None
+    return lxml.html.document_fromstring(resp.content, parser=parser)
+
+
+def node_text(el) -> str:
+    """Stripped text content, same as BeautifulSoup's get_text(strip=True)."""
+    return "".join(t.strip() for t in el.itertext())
+
+
 # ══════════════════════════════════════════════════════════════
 #  SCRAPERS
 # ══════════════════════════════════════════════════════════════
@@ -288,6 +580,13 @@ def polite_delay(min_s=1.5, max_s=3.5):
 class LinkedInScraper:
     SOURCE = "LinkedIn"
 
+    SEL_CARDS = XPathSelector(".base-card, .job-search-card, .result-card")
+    SEL_TITLE = XPathSelector(".base-search-card__title, .result-card__title, h3")
+    SEL_COMPANY = XPathSelector(".base-search-card__subtitle, .result-card__subtitle, h4")
+    SEL_LOCATION = XPathSelector(".job-search-card__location, .job-result-card__location")
+    SEL_LINK = XPathSelector("a.base-card__full-link, a")
+    SEL_DATE = XPathSelector("time")
+
     def __init__(self, session, config):
         self.session = session
         self.cfg = config
@@ -317,30 +616,30 @@ class LinkedInScraper:
                     polite_delay(3, 6)
                     continue
 
-                soup = BeautifulSoup(resp.text, "html.parser")
-                cards = soup.select(".base-card, .job-search-card, .result-card")
+                tree = parse_html(resp)
+                cards = self.SEL_CARDS.select(tree, limit=10)
 
-                for card in cards[:10]:
+                for card in cards:
                     try:
-                        title_el = card.select_one(".base-search-card__title, .result-card__title, h3")
-                        company_el = card.select_one(".base-search-card__subtitle, .result-card__subtitle, h4")
-                        loc_el = card.select_one(".job-search-card__location, .job-result-card__location")
-                        link_el = card.select_one("a.base-card__full-link, a")
-                        date_el = card.select_one("time")
+                        title_el = self.SEL_TITLE.select_one(card)
+                        company_el = self.SEL_COMPANY.select_one(card)
+                        loc_el = self.SEL_LOCATION.select_one(card)
+                        link_el = self.SEL_LINK.select_one(card)
+                        date_el = self.SEL_DATE.select_one(card)
 
-                        if title_el and company_el:
+                        if title_el is not None and company_el is not None:
                             jobs.append(JobPosting(
-                                title=title_el.get_text(strip=True),
-                                company=company_el.get_text(strip=True),
-                                location=loc_el.get_text(strip=True) if loc_el else "Germany",
-                                url=link_el["href"].split("?")[0] if link_el and link_el.get("href") else "",
+                                title=node_text(title_el),
+                                company=node_text(company_el),
+                                location=node_text(loc_el) if loc_el is not None else "Germany",
+                                url=link_el.get("href").split("?")[0] if link_el is not None and link_el.get("href") else "",
                                 source=self.SOURCE,
-                                date_posted=date_el.get("datetime", "") if date_el else "",
+                                date_posted=date_el.get("datetime", "") if date_el is not None else "",
                             ))
                     except Exception as e:
-                        log.debug(f"  Card parse error: {e}")
+                        log.debug("  Card parse error: %s", e)
 
-                polite_delay()
+                polite_delay(resp=resp)
 
             except Exception as e:
                 log.warning(f"  LinkedIn query failed: {e}")
@@ -352,6 +651,13 @@ class LinkedInScraper:
 class IndeedScraper:
     SOURCE = "Indeed"
 
+    SEL_CARDS = XPathSelector(".job_seen_beacon, .jobsearch-ResultsList > li, .result")
+    SEL_TITLE = XPathSelector(".jobTitle span, h2.jobTitle, .jcs-JobTitle")
+    SEL_COMPANY = XPathSelector(".companyName, [data-testid='company-name'], .company")
+    SEL_LOCATION = XPathSelector(".companyLocation, [data-testid='text-location']")
+    SEL_LINK = XPathSelector("a[href*='/rc/clk'], a[href*='viewjob'], h2 a")
+    SEL_SALARY = XPathSelector(".salary-snippet-container, .estimated-salary")
+
     def __init__(self, session, config):
         self.session = session
         self.cfg = config
@@ -371,36 +677,36 @@ class IndeedScraper:
                     polite_delay(3, 6)
                     continue
 
-                soup = BeautifulSoup(resp.text, "html.parser")
-                cards = soup.select(".job_seen_beacon, .jobsearch-ResultsList > li, .result")
+                tree = parse_html(resp)
+                cards = self.SEL_CARDS.select(tree, limit=10)
 
-                for card in cards[:10]:
+                for card in cards:
                     try:
-                        title_el = card.select_one(".jobTitle span, h2.jobTitle, .jcs-JobTitle")
-                        company_el = card.select_one(".companyName, [data-testid='company-name'], .company")
-                        loc_el = card.select_one(".companyLocation, [data-testid='text-location']")
-                        link_el = card.select_one("a[href*='/rc/clk'], a[href*='viewjob'], h2 a")
-                        salary_el = card.select_one(".salary-snippet-container, .estimated-salary")
+                        title_el = self.SEL_TITLE.select_one(card)
+                        company_el = self.SEL_COMPANY.select_one(card)
+                        loc_el = self.SEL_LOCATION.select_one(card)
+                        link_el = self.SEL_LINK.select_one(card)
+                        salary_el = self.SEL_SALARY.select_one(card)
 
-                        if title_el and company_el:
+                        if title_el is not None and company_el is not None:
                             href = ""
-                            if link_el and link_el.get("href"):
-                                href = link_el["href"]
+                            if link_el is not None and link_el.get("href"):
+                                href = link_el.get("href")
                                 if href.startswith("/"):
                                     href = f"https://de.indeed.com{href}"
 
                             jobs.append(JobPosting(
-                                title=title_el.get_text(strip=True),
-                                company=company_el.get_text(strip=True),
-                                location=loc_el.get_text(strip=True) if loc_el else "Germany",
+                                title=node_text(title_el),
+                                company=node_text(company_el),
+                                location=node_text(loc_el) if loc_el is not None else "Germany",
                                 url=href,
                                 source=self.SOURCE,
-                                salary_info=salary_el.get_text(strip=True) if salary_el else "",
+                                salary_info=node_text(salary_el) if salary_el is not None else "",
                             ))
                     except Exception as e:
-                        log.debug(f"  Card parse error: {e}")
+                        log.debug("  Card parse error: %s", e)
 
-                polite_delay()
+                polite_delay(resp=resp)
 
             except Exception as e:
                 log.warning(f"  Indeed query failed: {e}")
@@ -412,6 +718,12 @@ class IndeedScraper:
 class StepStoneScraper:
     SOURCE = "StepStone"
 
+    SEL_CARDS = XPathSelector("[data-testid='job-item'], .res-1p8ewa0, article")
+    SEL_TITLE = XPathSelector("[data-testid='job-item-title'], h2, .res-nehv70")
+    SEL_COMPANY = XPathSelector("[data-testid='job-item-company'], .res-1r68bfv")
+    SEL_LOCATION = XPathSelector("[data-testid='job-item-location'], .res-1w6cxnr")
+    SEL_LINK = XPathSelector("a[href*='stellenangebote'], a[href*='/jobs/']")
+
     def __init__(self, session, config):
         self.session = session
         self.cfg = config
@@ -430,34 +742,34 @@ class StepStoneScraper:
                     polite_delay(3, 6)
                     continue
 
-                soup = BeautifulSoup(resp.text, "html.parser")
-                cards = soup.select("[data-testid='job-item'], .res-1p8ewa0, article")
+                tree = parse_html(resp)
+                cards = self.SEL_CARDS.select(tree, limit=10)
 
-                for card in cards[:10]:
+                for card in cards:
                     try:
-                        title_el = card.select_one("[data-testid='job-item-title'], h2, .res-nehv70")
-                        company_el = card.select_one("[data-testid='job-item-company'], .res-1r68bfv")
-                        loc_el = card.select_one("[data-testid='job-item-location'], .res-1w6cxnr")
-                        link_el = card.select_one("a[href*='stellenangebote'], a[href*='/jobs/']")
+                        title_el = self.SEL_TITLE.select_one(card)
+                        company_el = self.SEL_COMPANY.select_one(card)
+                        loc_el = self.SEL_LOCATION.select_one(card)
+                        link_el = self.SEL_LINK.select_one(card)
 
-                        if title_el:
+                        if title_el is not None:
                             href = ""
-                            if link_el and link_el.get("href"):
-                                href = link_el["href"]
+                            if link_el is not None and link_el.get("href"):
+                                href = link_el.get("href")
                                 if href.startswith("/"):
                                     href = f"https://www.stepstone.de{href}"
 
                             jobs.append(JobPosting(
-                                title=title_el.get_text(strip=True),
-                                company=company_el.get_text(strip=True) if company_el else "",
-                                location=loc_el.get_text(strip=True) if loc_el else "Germany",
+                                title=node_text(title_el),
+                                company=node_text(company_el) if company_el is not None else "",
+                                location=node_text(loc_el) if loc_el is not None else "Germany",
                                 url=href,
                                 source=self.SOURCE,
                             ))
                     except Exception as e:
-                        log.debug(f"  Card parse error: {e}")
+                        log.debug("  Card parse error: %s", e)
 
-                polite_delay()
+                polite_delay(resp=resp)
 
             except Exception as e:
                 log.warning(f"  StepStone query failed: {e}")
@@ -468,65 +780,107 @@ class StepStoneScraper:
 
 class CompanyCareersScraper:
     SOURCE = "Direct"
+    MAX_WORKERS = 8
+    MAX_LINKS_PER_PAGE = 50
+
+    # A link is a posting candidate when its href, or an ancestor's class,
+    # looks job-related; ATS hosts only count inside a list item.
+    HREF_HINTS = ("job", "position", "career", "ashbyhq.com", "personio")
+    CLASS_HINTS = ("job", "opening", "position")
+    LIST_HREF_HINTS = ("lever.co", "greenhouse.io", "workable.com", "smartrecruiters", "recruitee")
 
     def __init__(self, session, config):
         self.session = session
         self.cfg = config
 
     def scrape(self) -> list[JobPosting]:
-        jobs = []
-        companies = self.cfg.target_companies
+        # Career pages live on different hosts, so fetch them concurrently;
+        # host_lock keeps the polite delay for companies sharing a host.
+        with ThreadPoolExecutor(max_workers=self.MAX_WORKERS) as pool:
+            results = pool.map(self._scrape_company, self.cfg.target_companies)
+        jobs = [job for company_jobs in results for job in company_jobs]
 
-        for company in companies:
-            try:
-                url = company["careers_url"]
-                name = company["name"]
-                log.info(f"  Careers: {name}")
+        log.info(f"  Direct careers: {len(jobs)} raw results")
+        return jobs
+
+    @classmethod
+    def _is_job_link(cls, el) -> bool:
+        href = el.get("href", "")
+        if any(hint in href for hint in cls.HREF_HINTS):
+            return True
+        in_list = False
+        for parent in el.iterancestors():
+            if any(hint in parent.get("class", "") for hint in cls.CLASS_HINTS):
+                return True
+            in_list = in_list or parent.tag == "li"
+        return in_list and any(hint in href for hint in cls.LIST_HREF_HINTS)
+
+    def _scrape_company(self, company) -> list[JobPosting]:
+        jobs = []
+        try:
+            url = company["careers_url"]
+            name = company["name"]
+            log.info(f"  Careers: {name}")
 
+            with host_lock(url):
                 resp = self.session.get(url, timeout=12)
-                if resp.status_code != 200:
+                polite_delay(1, 2, resp=resp)
+            if resp.status_code != 200:
+                return jobs
+
+            # Stream the page and stop once the quota is filled; career pages
+            # are mostly boilerplate, so there is no need to build the full tree.
+            found_links = set()
+            events = etree.iterparse(
+                io.BytesIO(resp.content), events=("start", "end"), html=True, encoding=html_encoding(resp),
+            )
+            anchor_depth = 0
+            for event, el in events:
+                if el.tag == "a":
+                    if event == "start":
+                        anchor_depth += 1
+                        continue
+                    anchor_depth -= 1
+                elif event == "start":
                     continue
+                if el.tag == "a" and self._is_job_link(el):
+                    href = el.get("href", "")
+                    text = node_text(el)
+                    if text and len(text) > 5 and href not in found_links:
+                        found_links.add(href)
+                        if not href.startswith("http"):
+                            href = url.rstrip("/") + "/" + href.lstrip("/")
+                        jobs.append(JobPosting(
+                            title=text,
+                            company=name,
+                            location=company.get("hq", "Germany"),
+                            url=href,
+                            source=f"{self.SOURCE} ({name})",
+                        ))
+                        if len(jobs) >= self.MAX_LINKS_PER_PAGE:
+                            break
+                # Finished subtrees are never looked at again, except inside an
+                # open <a> whose text node_text() still has to read; open
+                # ancestors (whose classes _is_job_link reads) are untouched.
+                if anchor_depth == 0:
+                    el.clear(keep_tail=True)
 
-                soup = BeautifulSoup(resp.text, "html.parser")
-
-                selectors = [
-                    "a[href*='job'], a[href*='position'], a[href*='career']",
-                    ".job-listing a, .opening a, .position a",
-                    "[class*='job'] a, [class*='opening'] a, [class*='position'] a",
-                    "li a[href*='lever.co'], li a[href*='greenhouse.io'], li a[href*='workable.com']",
-                    "li a[href*='smartrecruiters'], li a[href*='recruitee']",
-                    "a[href*='ashbyhq.com'], a[href*='personio']",
-                ]
-
-                found_links = set()
-                for selector in selectors:
-                    for el in soup.select(selector):
-                        href = el.get("href", "")
-                        text = el.get_text(strip=True)
-                        if text and len(text) > 5 and href not in found_links:
-                            found_links.add(href)
-                            if not href.startswith("http"):
-                                href = url.rstrip("/") + "/" + href.lstrip("/")
-                            jobs.append(JobPosting(
-                                title=text,
-                                company=name,
-                                location=company.get("hq", "Germany"),
-                                url=href,
-                                source=f"{self.SOURCE} ({name})",
-                            ))
-
-                polite_delay(1, 2)
-
-            except Exception as e:
-                log.debug(f"  {company['name']} career page error: {e}")
-
-        log.info(f"  Direct careers: {len(jobs)} raw results")
+        except Exception as e:
+            log.debug("  %s career page error: %s", company["name"], e)
         return jobs
 
 
 class StartupJobBoardScraper:
     SOURCE = "StartupBoard"
 
+    SEL_BSJ_CARDS = XPathSelector(".bsj-jb, .job-listing, article")
+    SEL_BSJ_TITLE = XPathSelector("h4 a, .bsj-jb__title a, h3 a")
+    SEL_BSJ_COMPANY = XPathSelector(".bsj-jb__company, .company-name")
+    SEL_GTJ_CARDS = XPathSelector(".card, .job-card, article, .job-listing")
+    SEL_GTJ_TITLE = XPathSelector("h2 a, h3 a, .card-title a, a.job-title")
+    SEL_GTJ_COMPANY = XPathSelector(".company, .card-subtitle, .employer")
+    SEL_GTJ_LOCATION = XPathSelector(".location, .city")
+
     def __init__(self, session, config):
         self.session = session
         self.cfg = config
@@ -541,19 +895,19 @@ class StartupJobBoardScraper:
                 if resp.status_code != 200:
                     continue
 
-                soup = BeautifulSoup(resp.text, "html.parser")
-                for card in soup.select(".bsj-jb, .job-listing, article")[:15]:
-                    title_el = card.select_one("h4 a, .bsj-jb__title a, h3 a")
-                    company_el = card.select_one(".bsj-jb__company, .company-name")
-                    if title_el:
+                tree = parse_html(resp)
+                for card in self.SEL_BSJ_CARDS.select(tree, limit=15):
+                    title_el = self.SEL_BSJ_TITLE.select_one(card)
+                    company_el = self.SEL_BSJ_COMPANY.select_one(card)
+                    if title_el is not None:
                         jobs.append(JobPosting(
-                            title=title_el.get_text(strip=True),
-                            company=company_el.get_text(strip=True) if company_el else "",
+                            title=node_text(title_el),
+                            company=node_text(company_el) if company_el is not None else "",
                             location="Berlin, Germany",
                             url=title_el.get("href", ""),
                             source="BerlinStartupJobs",
                         ))
-                polite_delay(1, 2)
+                polite_delay(1, 2, resp=resp)
         except Exception as e:
             log.warning(f"  BerlinStartupJobs error: {e}")
         return jobs
@@ -568,31 +922,38 @@ class StartupJobBoardScraper:
                 if resp.status_code != 200:
                     continue
 
-                soup = BeautifulSoup(resp.text, "html.parser")
-                for card in soup.select(".card, .job-card, article, .job-listing")[:10]:
-                    title_el = card.select_one("h2 a, h3 a, .card-title a, a.job-title")
-                    company_el = card.select_one(".company, .card-subtitle, .employer")
-                    loc_el = card.select_one(".location, .city")
-                    if title_el:
+                tree = parse_html(resp)
+                for card in self.SEL_GTJ_CARDS.select(tree, limit=10):
+                    title_el = self.SEL_GTJ_TITLE.select_one(card)
+                    company_el = self.SEL_GTJ_COMPANY.select_one(card)
+                    loc_el = self.SEL_GTJ_LOCATION.select_one(card)
+                    if title_el is not None:
                         href = title_el.get("href", "")
                         if href and not href.startswith("http"):
                             href = f"https://germantechjobs.de{href}"
                         jobs.append(JobPosting(
-                            title=title_el.get_text(strip=True),
-                            company=company_el.get_text(strip=True) if company_el else "",
-                            location=loc_el.get_text(strip=True) if loc_el else "Germany",
+                            title=node_text(title_el),
+                            company=node_text(company_el) if company_el is not None else "",
+                            location=node_text(loc_el) if loc_el is not None else "Germany",
                             url=href,
                             source="GermanTechJobs",
                         ))
-                polite_delay(1, 2)
+                polite_delay(1, 2, resp=resp)
         except Exception as e:
             log.warning(f"  GermanTechJobs error: {e}")
         return jobs
 
     def scrape(self) -> list[JobPosting]:
+        # The two boards are separate hosts, so their request loops (and
+        # polite delays) can overlap; queries to one board stay sequential.
         jobs = []
-        jobs.extend(self._scrape_berlin_startup_jobs())
-        jobs.extend(self._scrape_german_tech_jobs())
+        with ThreadPoolExecutor(max_workers=2, thread_name_prefix="startups") as pool:
+            futures = [
+                pool.submit(self._scrape_berlin_startup_jobs),
+                pool.submit(self._scrape_german_tech_jobs),
+            ]
+            for future in futures:
+                jobs.extend(future.result())
         log.info(f"  Startup boards: {len(jobs)} raw results")
         return jobs
 
@@ -600,6 +961,11 @@ class StartupJobBoardScraper:
 class RemoteJobScraper:
     SOURCE = "Remote"
 
+    SEL_ROWS = XPathSelector("tr.job, .job")
+    SEL_TITLE = XPathSelector("h2, .company_and_position h2")
+    SEL_COMPANY = XPathSelector("h3, .companyLink h3")
+    SEL_LINK = XPathSelector("a[href*='/remote-jobs/']")
+
     def __init__(self, session, config):
         self.session = session
         self.cfg = config
@@ -608,28 +974,28 @@ class RemoteJobScraper:
         jobs = []
         try:
             url = "https://remoteok.com/remote-healthcare-jobs"
-            log.info(f"  RemoteOK: healthcare")
+            log.info("  RemoteOK: healthcare")
             resp = self.session.get(url, timeout=12)
             if resp.status_code == 200:
-                soup = BeautifulSoup(resp.text, "html.parser")
-                for row in soup.select("tr.job, .job")[:15]:
-                    title_el = row.select_one("h2, .company_and_position h2")
-                    company_el = row.select_one("h3, .companyLink h3")
-                    link_el = row.select_one("a[href*='/remote-jobs/']")
-                    if title_el:
+                tree = parse_html(resp)
+                for row in self.SEL_ROWS.select(tree, limit=15):
+                    title_el = self.SEL_TITLE.select_one(row)
+                    company_el = self.SEL_COMPANY.select_one(row)
+                    link_el = self.SEL_LINK.select_one(row)
+                    if title_el is not None:
                         href = ""
-                        if link_el:
+                        if link_el is not None:
                             href = link_el.get("href", "")
                             if href.startswith("/"):
                                 href = f"https://remoteok.com{href}"
                         jobs.append(JobPosting(
-                            title=title_el.get_text(strip=True),
-                            company=company_el.get_text(strip=True) if company_el else "",
+                            title=node_text(title_el),
+                            company=node_text(company_el) if company_el is not None else "",
                             location="Remote",
                             url=href,
                             source="RemoteOK",
                         ))
-            polite_delay()
+            polite_delay(resp=resp)
         except Exception as e:
             log.warning(f"  RemoteOK error: {e}")
 
@@ -641,68 +1007,108 @@ class RemoteJobScraper:
 #  REPORT GENERATOR
 # ══════════════════════════════════════════════════════════════
 
-class ReportGenerator:
-    def __init__(self, config: Config):
-        self.cfg = config
-        self.report_dir = Path("reports")
-        self.report_dir.mkdir(parents=True, exist_ok=True)
-        self.docs_dir = Path("docs")
-        self.docs_dir.mkdir(parents=True, exist_ok=True)
-
-    def generate(self, jobs: list[JobPosting], seen_db: SeenJobsDB) -> str:
-        today = datetime.now().strftime("%Y-%m-%d")
-        time_str = datetime.now().strftime("%H:%M")
-
-        jobs.sort(key=lambda j: j.relevance_score, reverse=True)
-
-        # ── Individual HTML Report ──
-        html = self._build_html(jobs, today, time_str)
-
-        # Save dated report
-        dated_path = self.report_dir / f"job-report-{today}.html"
-        with open(dated_path, "w", encoding="utf-8") as f:
-            f.write(html)
+# Page templates are parsed once at import; {{ }} escapes literal CSS braces.
+# The per-job row uses %-formatting, which is cheaper for a template filled
+# once per job (the page CSS has literal % signs, so pages stay on format()).
+REPORT_LINK_TEMPLATE = """
+            <a href="{href}" class="report-link {css_class}">
+                <span class="date">{date}</span>
+                {badge}
+            </a>"""
 
-        # Save as "latest" for email + artifact
-        latest_path = self.report_dir / "latest-report.html"
-        with open(latest_path, "w", encoding="utf-8") as f:
-            f.write(html)
+REPORT_ROW_TEMPLATE = """
+            <tr class="job-row" onclick="this.classList.toggle('expanded')">
+                <td class="rank">%(rank)s</td>
+                <td>
+                    <div class="title"><a href="%(url)s" target="_blank" rel="noopener">%(title)s</a></div>
+                    <div class="company">%(company)s</div>
+                    <div class="meta">
+                        <span class="location">📍 %(location)s</span>
+                        <span class="source">via %(source)s</span>
+                        %(salary)s
+                        %(date)s
+                    </div>
+                    <div class="reasons">%(reasons)s</div>
+                </td>
+                <td>
+                    <div class="score" style="background-color: %(color)s">
+                        %(score).0f
+                    </div>
+                </td>
+            </tr>"""
 
-        # ── Markdown ──
-        md = self._build_markdown(jobs, today, time_str)
-        md_path = self.report_dir / "latest-report.md"
-        with open(md_path, "w", encoding="utf-8") as f:
-            f.write(md)
+# Score badge colour / markdown marker by tier: below 50, 50–69, 70+
+SCORE_COLORS = ("#94a3b8", "#ca8a04", "#16a34a")
+SCORE_EMOJI = ("⚪", "🟡", "🟢")
 
-        # ── GitHub Pages: copy to docs/ + update index ──
-        docs_report = self.docs_dir / f"report-{today}.html"
-        with open(docs_report, "w", encoding="utf-8") as f:
-            f.write(html)
 
-        self._update_pages_index(jobs, today, seen_db)
+def score_tier(score) -> int:
+    """0, 1 or 2 for scores below 50, 50–69 and 70+ (indexes SCORE_COLORS/SCORE_EMOJI)."""
+    return (score >= 50) + (score >= 70)
 
-        log.info(f"Reports saved: {dated_path}, {docs_report}")
-        return str(latest_path)
 
-    def _update_pages_index(self, jobs, today, seen_db):
-        """Build a dashboard index.html for GitHub Pages listing all reports."""
-        # Find all existing reports in docs/
-        reports = sorted(self.docs_dir.glob("report-*.html"), reverse=True)
-
-        report_links = ""
-        for rp in reports[:60]:
-            date_str = rp.stem.replace("report-", "")
-            is_today = date_str == today
-            badge = f'<span class="badge new">TODAY — {len(jobs)} jobs</span>' if is_today else ""
-            report_links += f'''
-            <a href="{rp.name}" class="report-link {'today' if is_today else ''}">
-                <span class="date">{date_str}</span>
-                {badge}
-            </a>'''
+REPORT_EMPTY_ROW = '<tr><td colspan="3" class="empty">No new relevant jobs found today. Check back tomorrow!</td></tr>'
 
-        stats = seen_db.data.get("stats", {})
+REPORT_TEMPLATE = """<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="UTF-8">
+<meta name="viewport" content="width=device-width, initial-scale=1.0">
+<title>Job Report — {today}</title>
+<style>
+    :root {{ --bg: #0f172a; --card: #1e293b; --text: #e2e8f0; --muted: #94a3b8; --accent: #38bdf8; }}
+    * {{ margin: 0; padding: 0; box-sizing: border-box; }}
+    body {{ font-family: 'Inter', -apple-system, system-ui, sans-serif; background: var(--bg); color: var(--text); padding: 2rem; }}
+    .container {{ max-width: 960px; margin: 0 auto; }}
+    header {{ text-align: center; margin-bottom: 2rem; padding: 2rem; background: linear-gradient(135deg, #1e293b 0%, #0f172a 100%); border-radius: 16px; border: 1px solid #334155; }}
+    header h1 {{ font-size: 1.8rem; margin-bottom: 0.5rem; background: linear-gradient(135deg, #38bdf8, #818cf8); -webkit-background-clip: text; -webkit-text-fill-color: transparent; }}
+    header p {{ color: var(--muted); font-size: 0.95rem; }}
+    .stats {{ display: flex; gap: 1rem; justify-content: center; margin-top: 1rem; flex-wrap: wrap; }}
+    .stat {{ background: #334155; padding: 0.5rem 1rem; border-radius: 8px; font-size: 0.85rem; }}
+    .stat strong {{ color: var(--accent); }}
+    .back-link {{ display: inline-block; margin-bottom: 1.5rem; color: var(--accent); text-decoration: none; font-size: 0.9rem; }}
+    .back-link:hover {{ text-decoration: underline; }}
+    table {{ width: 100%; border-collapse: collapse; }}
+    .job-row {{ background: var(--card); cursor: pointer; transition: background 0.2s; }}
+    .job-row:hover {{ background: #334155; }}
+    .job-row td {{ padding: 1rem; border-bottom: 1px solid #334155; vertical-align: top; }}
+    .rank {{ width: 40px; text-align: center; color: var(--muted); font-weight: 600; }}
+    .title a {{ color: var(--accent); text-decoration: none; font-weight: 600; font-size: 1.05rem; }}
+    .title a:hover {{ text-decoration: underline; }}
+    .company {{ color: #f1f5f9; margin: 0.25rem 0; font-weight: 500; }}
+    .meta {{ display: flex; flex-wrap: wrap; gap: 0.75rem; color: var(--muted); font-size: 0.8rem; margin-top: 0.4rem; }}
+    .score {{ width: 42px; height: 42px; border-radius: 50%; display: flex; align-items: center; justify-content: center; color: white; font-weight: 700; font-size: 0.85rem; }}
+    .reasons {{ display: none; margin-top: 0.6rem; font-size: 0.8rem; color: var(--muted); line-height: 1.6; }}
+    .expanded .reasons {{ display: block; }}
+    .empty {{ text-align: center; padding: 3rem; color: var(--muted); }}
+    footer {{ text-align: center; margin-top: 2rem; color: var(--muted); font-size: 0.8rem; }}
+</style>
+</head>
+<body>
+<div class="container">
+    <a href="index.html" class="back-link">← Dashboard</a>
+    <header>
+        <h1>🎯 Daily Job Report</h1>
+        <p>Healthcare · Digital Health · Pharma — Scale-ups & Innovation Centers</p>
+        <div class="stats">
+            <div class="stat"><strong>{job_count}</strong> new matches</div>
+            <div class="stat"><strong>{today}</strong> {time_str}</div>
+            <div class="stat"><strong>{high_count}</strong> high relevance</div>
+        </div>
+    </header>
+    <table>
+        <tbody>
+            {rows}
+        </tbody>
+    </table>
+    <footer>
+        <p>Click any row to see match details · Auto-generated by JobScraper</p>
+    </footer>
+</div>
+</body>
+</html>"""
 
-        index_html = f"""<!DOCTYPE html>
+INDEX_TEMPLATE = """<!DOCTYPE html>
 <html lang="en">
 <head>
 <meta charset="UTF-8">
@@ -727,6 +1133,7 @@ class ReportGenerator:
     .report-link .date {{ font-weight: 600; font-size: 1rem; }}
     .badge {{ font-size: 0.75rem; padding: 0.25rem 0.6rem; border-radius: 20px; font-weight: 600; }}
     .badge.new {{ background: var(--green); color: #0f172a; }}
+    .badge.count {{ background: #334155; color: var(--muted); }}
     footer {{ text-align: center; margin-top: 3rem; padding: 1rem; color: var(--muted); font-size: 0.8rem; }}
     footer a {{ color: var(--accent); text-decoration: none; }}
 </style>
@@ -740,15 +1147,15 @@ class ReportGenerator:
 
     <div class="stats-grid">
         <div class="stat-card">
-            <div class="number">{len(jobs)}</div>
+            <div class="number">{today_count}</div>
             <div class="label">Today's Matches</div>
         </div>
         <div class="stat-card">
-            <div class="number">{stats.get('total_reported', 0)}</div>
+            <div class="number">{total_reported}</div>
             <div class="label">Total Reported</div>
         </div>
         <div class="stat-card">
-            <div class="number">{len(reports)}</div>
+            <div class="number">{report_count}</div>
             <div class="label">Reports Generated</div>
         </div>
     </div>
@@ -763,97 +1170,136 @@ class ReportGenerator:
 </body>
 </html>"""
 
-        with open(self.docs_dir / "index.html", "w", encoding="utf-8") as f:
-            f.write(index_html)
+
+def write_atomic(path: Path, data: bytes):
+    """Write via a temp file + os.replace so readers never see a partial file."""
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
+
+
+class ReportGenerator:
+    def __init__(self, config: Config):
+        self.cfg = config
+        self.report_dir = Path("reports")
+        self.report_dir.mkdir(parents=True, exist_ok=True)
+        self.docs_dir = Path("docs")
+        self.docs_dir.mkdir(parents=True, exist_ok=True)
+        self.manifest_path = self.docs_dir / "_manifest.json"
+
+    def generate(self, jobs: list[JobPosting], seen_db: SeenJobsDB, now: Optional[datetime] = None) -> str:
+        now = now or datetime.now()
+        today = now.strftime("%Y-%m-%d")
+        time_str = now.strftime("%H:%M")
+
+        jobs.sort(key=lambda j: j.relevance_score, reverse=True)
+
+        # ── Individual HTML Report ──
+        html = self._build_html(jobs, today, time_str)
+
+        # Encode once; the same bytes go to the dated report, the "latest"
+        # copy for email + artifact, and the GitHub Pages copy in docs/
+        html_bytes = html.encode("utf-8")
+        dated_path = self.report_dir / f"job-report-{today}.html"
+        latest_path = self.report_dir / "latest-report.html"
+        docs_report = self.docs_dir / f"report-{today}.html"
+        for path in (dated_path, latest_path, docs_report):
+            write_atomic(path, html_bytes)
+
+        # ── Markdown ──
+        md = self._build_markdown(jobs, today, time_str)
+        write_atomic(self.report_dir / "latest-report.md", md.encode("utf-8"))
+
+        self._update_pages_index(jobs, today, seen_db)
+
+        log.info(f"Reports saved: {dated_path}, {docs_report}")
+        return str(latest_path)
+
+    def _load_manifest(self) -> list[dict]:
+        """Reports listed on the dashboard, newest first.
+
+        Kept in docs/_manifest.json and updated once per run; rebuilt from
+        the report files in docs/ if it's missing or unreadable.
+        """
+        try:
+            return json.loads(self.manifest_path.read_text(encoding="utf-8"))
+        except (FileNotFoundError, json.JSONDecodeError):
+            reports = sorted(self.docs_dir.glob("report-*.html"), reverse=True)
+            return [{"date": rp.stem.replace("report-", ""), "path": rp.name} for rp in reports]
+
+    def _update_pages_index(self, jobs, today, seen_db):
+        """Build a dashboard index.html for GitHub Pages listing all reports."""
+        reports = [r for r in self._load_manifest() if r["date"] != today]
+        reports.append({
+            "date": today,
+            "path": f"report-{today}.html",
+            "jobs": len(jobs),
+            "high": sum(1 for j in jobs if j.relevance_score >= 70),
+        })
+        reports.sort(key=lambda r: r["date"], reverse=True)
+        write_atomic(self.manifest_path, json.dumps(reports, indent=1).encode("utf-8"))
+
+        links = []
+        for report in reports[:60]:
+            is_today = report["date"] == today
+            if is_today:
+                badge = f'<span class="badge new">TODAY — {len(jobs)} jobs</span>'
+            elif "jobs" in report:
+                # Entries rebuilt from the report files have no counts
+                badge = f'<span class="badge count">{report["jobs"]} jobs · {report["high"]} high</span>'
+            else:
+                badge = ""
+            links.append(REPORT_LINK_TEMPLATE.format(
+                href=report["path"],
+                css_class="today" if is_today else "",
+                date=report["date"],
+                badge=badge,
+            ))
+        report_links = "".join(links)
+
+        stats = seen_db.stats
+
+        index_html = INDEX_TEMPLATE.format(
+            today_count=len(jobs),
+            total_reported=stats.get("total_reported", 0),
+            report_count=len(reports),
+            report_links=report_links,
+        )
+
+        write_atomic(self.docs_dir / "index.html", index_html.encode("utf-8"))
 
     def _build_html(self, jobs, today, time_str):
-        rows = ""
+        rows = []
         for i, job in enumerate(jobs, 1):
-            score_color = (
-                "#16a34a" if job.relevance_score >= 70
-                else "#ca8a04" if job.relevance_score >= 50
-                else "#94a3b8"
-            )
-            reasons_html = "<br>".join(f"• {r}" for r in job.match_reasons)
-            rows += f"""
-            <tr class="job-row" onclick="this.classList.toggle('expanded')">
-                <td class="rank">{i}</td>
-                <td>
-                    <div class="title"><a href="{job.url}" target="_blank" rel="noopener">{job.title}</a></div>
-                    <div class="company">{job.company}</div>
-                    <div class="meta">
-                        <span class="location">📍 {job.location}</span>
-                        <span class="source">via {job.source}</span>
-                        {f'<span class="salary">💰 {job.salary_info}</span>' if job.salary_info else ''}
-                        {f'<span class="date">📅 {job.date_posted[:10]}</span>' if job.date_posted else ''}
-                    </div>
-                    <div class="reasons">{reasons_html}</div>
-                </td>
-                <td>
-                    <div class="score" style="background-color: {score_color}">
-                        {job.relevance_score:.0f}
-                    </div>
-                </td>
-            </tr>"""
-
-        return f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-<meta charset="UTF-8">
-<meta name="viewport" content="width=device-width, initial-scale=1.0">
-<title>Job Report — {today}</title>
-<style>
-    :root {{ --bg: #0f172a; --card: #1e293b; --text: #e2e8f0; --muted: #94a3b8; --accent: #38bdf8; }}
-    * {{ margin: 0; padding: 0; box-sizing: border-box; }}
-    body {{ font-family: 'Inter', -apple-system, system-ui, sans-serif; background: var(--bg); color: var(--text); padding: 2rem; }}
-    .container {{ max-width: 960px; margin: 0 auto; }}
-    header {{ text-align: center; margin-bottom: 2rem; padding: 2rem; background: linear-gradient(135deg, #1e293b 0%, #0f172a 100%); border-radius: 16px; border: 1px solid #334155; }}
-    header h1 {{ font-size: 1.8rem; margin-bottom: 0.5rem; background: linear-gradient(135deg, #38bdf8, #818cf8); -webkit-background-clip: text; -webkit-text-fill-color: transparent; }}
-    header p {{ color: var(--muted); font-size: 0.95rem; }}
-    .stats {{ display: flex; gap: 1rem; justify-content: center; margin-top: 1rem; flex-wrap: wrap; }}
-    .stat {{ background: #334155; padding: 0.5rem 1rem; border-radius: 8px; font-size: 0.85rem; }}
-    .stat strong {{ color: var(--accent); }}
-    .back-link {{ display: inline-block; margin-bottom: 1.5rem; color: var(--accent); text-decoration: none; font-size: 0.9rem; }}
-    .back-link:hover {{ text-decoration: underline; }}
-    table {{ width: 100%; border-collapse: collapse; }}
-    .job-row {{ background: var(--card); cursor: pointer; transition: background 0.2s; }}
-    .job-row:hover {{ background: #334155; }}
-    .job-row td {{ padding: 1rem; border-bottom: 1px solid #334155; vertical-align: top; }}
-    .rank {{ width: 40px; text-align: center; color: var(--muted); font-weight: 600; }}
-    .title a {{ color: var(--accent); text-decoration: none; font-weight: 600; font-size: 1.05rem; }}
-    .title a:hover {{ text-decoration: underline; }}
-    .company {{ color: #f1f5f9; margin: 0.25rem 0; font-weight: 500; }}
-    .meta {{ display: flex; flex-wrap: wrap; gap: 0.75rem; color: var(--muted); font-size: 0.8rem; margin-top: 0.4rem; }}
-    .score {{ width: 42px; height: 42px; border-radius: 50%; display: flex; align-items: center; justify-content: center; color: white; font-weight: 700; font-size: 0.85rem; }}
-    .reasons {{ display: none; margin-top: 0.6rem; font-size: 0.8rem; color: var(--muted); line-height: 1.6; }}
-    .expanded .reasons {{ display: block; }}
-    .empty {{ text-align: center; padding: 3rem; color: var(--muted); }}
-    footer {{ text-align: center; margin-top: 2rem; color: var(--muted); font-size: 0.8rem; }}
-</style>
-</head>
-<body>
-<div class="container">
-    <a href="index.html" class="back-link">← Dashboard</a>
-    <header>
-        <h1>🎯 Daily Job Report</h1>
-        <p>Healthcare · Digital Health · Pharma — Scale-ups & Innovation Centers</p>
-        <div class="stats">
-            <div class="stat"><strong>{len(jobs)}</strong> new matches</div>
-            <div class="stat"><strong>{today}</strong> {time_str}</div>
-            <div class="stat"><strong>{len([j for j in jobs if j.relevance_score >= 70])}</strong> high relevance</div>
-        </div>
-    </header>
-    <table>
-        <tbody>
-            {rows if jobs else '<tr><td colspan="3" class="empty">No new relevant jobs found today. Check back tomorrow!</td></tr>'}
-        </tbody>
-    </table>
-    <footer>
-        <p>Click any row to see match details · Auto-generated by JobScraper</p>
-    </footer>
-</div>
-</body>
-</html>"""
+            # Scraped fields are escaped so a stray & or < can't break the page
+            rows.append(REPORT_ROW_TEMPLATE % {
+                "rank": i,
+                "url": escape(job.url),
+                "title": escape(job.title),
+                "company": escape(job.company),
+                "location": escape(job.location),
+                "source": escape(job.source),
+                "salary": f'<span class="salary">💰 {escape(job.salary_info)}</span>' if job.salary_info else "",
+                "date": f'<span class="date">📅 {escape(job.date_posted[:10])}</span>' if job.date_posted else "",
+                "reasons": self._reasons_html(job.match_reasons),
+                "color": SCORE_COLORS[score_tier(job.relevance_score)],
+                "score": job.relevance_score,
+            })
+
+        return REPORT_TEMPLATE.format(
+            today=today,
+            time_str=time_str,
+            job_count=len(jobs),
+            high_count=len([j for j in jobs if j.relevance_score >= 70]),
+            rows="".join(rows) if jobs else REPORT_EMPTY_ROW,
+        )
+
+    @staticmethod
+    def _reasons_html(reasons) -> str:
+        """Bulleted match reasons, HTML-escaped (config names may contain & or <)."""
+        if not reasons:
+            return ""
+        return "<br>".join(["• " + escape(r, quote=False) for r in reasons])
 
     def _build_markdown(self, jobs, today, time_str):
         lines = [
@@ -866,8 +1312,7 @@ class ReportGenerator:
         ]
 
         for i, job in enumerate(jobs, 1):
-            emoji = "🟢" if job.relevance_score >= 70 else "🟡" if job.relevance_score >= 50 else "⚪"
-            lines.append(f"### {i}. {emoji} {job.title}")
+            lines.append(f"### {i}. {SCORE_EMOJI[score_tier(job.relevance_score)]} {job.title}")
             lines.append(f"**{job.company}** · 📍 {job.location} · Score: {job.relevance_score:.0f}/100")
             if job.salary_info:
                 lines.append(f"💰 {job.salary_info}")
@@ -884,11 +1329,25 @@ class ReportGenerator:
 #  MAIN ORCHESTRATOR
 # ══════════════════════════════════════════════════════════════
 
+def run_scraper(name, scraper_cls, session, cfg) -> list[JobPosting]:
+    log.info(f"Scraping: {name.upper()}")
+    try:
+        scraper = scraper_cls(session, cfg)
+        return scraper.scrape()
+    except Exception as e:
+        log.error(f"Scraper {name} failed: {e}")
+        return []
+
+
 def run(args):
-    log.info("=" * 60)
+    log.info(BANNER)
     log.info("  JOB SCRAPER — Starting daily run")
     log.info(f"  Environment: {'GitHub Actions' if IS_CI else 'Local'}")
-    log.info("=" * 60)
+    log.info(BANNER)
+
+    # One timestamp for the whole run: first_seen, last_run, and the report
+    # date/filenames all agree even if the run straddles midnight.
+    now = datetime.now()
 
     cfg = Config(args.config)
     log.info(f"Config loaded: {len(cfg.search_queries)} queries, {len(cfg.target_companies)} companies")
@@ -897,8 +1356,8 @@ def run(args):
         log.info("DRY RUN — Config valid. Exiting.")
         return
 
-    session = create_session()
-    seen_db = SeenJobsDB("./data/seen_jobs.json")
+    session = create_session(use_cache=not args.no_cache)
+    seen_db = SeenJobsDB("./data/seen_jobs.db")
     scorer = RelevanceScorer(cfg)
     reporter = ReportGenerator(cfg)
 
@@ -906,7 +1365,7 @@ def run(args):
         seen_db.reset()
         return
 
-    seen_db.cleanup(days=30)
+    seen_db.cleanup(days=30, now=now)
 
     # ── Run scrapers ──
     all_jobs = []
@@ -928,59 +1387,84 @@ def run(args):
             log.error(f"Unknown source: {args.source}")
             return
 
-    for name, scraper_cls in active_scrapers.items():
-        log.info(f"\n{'─' * 40}")
-        log.info(f"Scraping: {name.upper()}")
-        log.info(f"{'─' * 40}")
-        try:
-            scraper = scraper_cls(session, cfg)
-            jobs = scraper.scrape()
-            all_jobs.extend(jobs)
-        except Exception as e:
-            log.error(f"Scraper {name} failed: {e}")
+    log.info("\n" + SECTION_RULE)
+    log.info(f"Scraping {len(active_scrapers)} source(s) in parallel")
+    log.info(SECTION_RULE)
+
+    # Each source talks to its own host(s), so running them side by side keeps
+    # every per-host polite delay while overlapping the network waits.
+    with ThreadPoolExecutor(max_workers=len(active_scrapers), thread_name_prefix="scrape") as pool:
+        futures = [
+            pool.submit(run_scraper, name, scraper_cls, session, cfg)
+            for name, scraper_cls in active_scrapers.items()
+        ]
+        for future in futures:
+            all_jobs.extend(future.result())
 
     log.info(f"\nTotal raw results: {len(all_jobs)}")
 
     # ── Deduplicate ──
-    seen_urls = set()
-    unique_jobs = []
+    unique = {}
     for job in all_jobs:
-        key = job.url if job.url else f"{job.title}|{job.company}"
-        if key not in seen_urls:
-            seen_urls.add(key)
-            unique_jobs.append(job)
+        unique.setdefault(job.url or f"{job.title}|{job.company}", job)
+    unique_jobs = list(unique.values())
 
     log.info(f"After deduplication: {len(unique_jobs)}")
 
     # ── Score ──
-    scored_jobs = [scorer.score(job) for job in unique_jobs]
+    # Jobs seen on an earlier run can never be reported again, so they reuse
+    # their stored score instead of being re-scored. The same role reposted
+    # across boards keeps only its best-scoring copy.
+    seen_scores = seen_db.seen_scores(job.job_id for job in unique_jobs)
+    best = {}
+    for job in unique_jobs:
+        stored = seen_scores.get(job.job_id)
+        if stored is not None:
+            job.relevance_score = stored
+        else:
+            scorer.score(job)
+        key = job.signature
+        kept = best.setdefault(key, job)
+        if job.relevance_score > kept.relevance_score:
+            best[key] = job
 
-    # ── Filter ──
-    relevant_jobs = [j for j in scored_jobs if j.relevance_score >= cfg.min_score]
-    log.info(f"Above threshold ({cfg.min_score}): {len(relevant_jobs)}")
+    log.info(f"After merging reposts: {len(best)}")
 
-    new_jobs = [j for j in relevant_jobs if seen_db.is_new(j)]
+    # ── Filter ──
+    # One pass for both the threshold and the seen check
+    threshold = cfg.min_score
+    relevant_count = 0
+    new_jobs = []
+    for job in best.values():
+        if job.relevance_score < threshold:
+            continue
+        relevant_count += 1
+        if job.job_id not in seen_scores:
+            new_jobs.append(job)
+
+    log.info(f"Above threshold ({threshold}): {relevant_count}")
     log.info(f"New (not seen before): {len(new_jobs)}")
 
-    for job in new_jobs:
-        seen_db.mark_seen(job)
+    seen_db.mark_seen_many(new_jobs, now)
     seen_db.update_stats(len(new_jobs))
-    seen_db.save()
+    seen_db.save(now)
 
     # ── Set CI env vars for downstream steps ──
-    today = datetime.now().strftime("%Y-%m-%d")
+    today = now.strftime("%Y-%m-%d")
     set_github_env("REPORT_DATE", today)
     set_github_env("JOB_COUNT", str(len(new_jobs)))
 
     # ── Generate report (even if empty, so Pages stays updated) ──
     max_results = cfg.output.get("max_results_per_report", 50)
-    report_jobs = new_jobs[:max_results]
-    report_path = reporter.generate(report_jobs, seen_db)
+    # Top-k selection (same result as sorting then slicing, ties included)
+    report_jobs = heapq.nlargest(max_results, new_jobs, key=lambda j: j.relevance_score)
+    report_path = reporter.generate(report_jobs, seen_db, now)
+    seen_db.close()
 
-    log.info(f"\n{'═' * 40}")
+    log.info("\n" + DONE_RULE)
     log.info(f"✅ Done! {len(report_jobs)} jobs in today's report.")
     log.info(f"Report: {report_path}")
-    log.info(f"{'═' * 40}")
+    log.info(DONE_RULE)
 
 
 def main():
@@ -989,6 +1473,7 @@ def main():
     parser.add_argument("--dry-run", action="store_true", help="Validate config only")
     parser.add_argument("--source", type=str, help="Scrape single source")
     parser.add_argument("--reset", action="store_true", help="Reset seen jobs database")
+    parser.add_argument("--no-cache", action="store_true", help="Bypass the HTTP response cache")
     args = parser.parse_args()
     run(args)
 